@@ -1,5 +1,8 @@
 # main.py
 
+import logging
+import os
+
 from server import mcp
 
 import tools.data_tools
@@ -10,7 +13,17 @@ import prompts.backtest_portfolio_prompts
 import resources.data_resources
 
 
+def _log_level() -> str:
+    """Log level from SIMPLE_BACKTEST_LOGLEVEL, falling back to WARNING if unset or unknown."""
+    level = os.environ.get('SIMPLE_BACKTEST_LOGLEVEL', 'WARNING').strip().upper()
+    return level if level in ('CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG') else 'WARNING'
+
+
 def main():
+    # FastMCP already configures the root logger when the server is created,
+    # which makes basicConfig a no-op, so set the level on the root logger too
+    logging.basicConfig(level=_log_level())
+    logging.getLogger().setLevel(_log_level())
     mcp.run(transport='stdio')
 
 
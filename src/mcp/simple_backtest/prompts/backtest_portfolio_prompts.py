@@ -5,39 +5,41 @@
 backtest_portfolio_prompts.py:
 """
 
+import re
 from typing import List
+import numpy as np
 from resources.data_resources import available_tickers
 from server import mcp
 
+# tickers and weights may be separated by commas and/or whitespace
+_SEPARATORS = re.compile(r"[,\s]+")
+
 
 @mcp.prompt("backtest_portfolio")
 def backtest_portfolio(tickers: str, weights: str) -> str:
     """
         Backtest a portfolio given a list of tickers and their weights.
     Args:
-        tickers (str): Comma-separated string of ticker symbols.
-        weights (str): Comma-separated string of weights corresponding to the tickers.
+        tickers (str): Comma- or space-separated string of ticker symbols.
+        weights (str): Comma- or space-separated string of weights corresponding to the tickers.
     Returns:
     """
-    tickers_univ = available_tickers()
-    input_tickers = tickers.split(",")
-    input_weights = weights.split(",")
+    tickers_univ = frozenset(available_tickers())
+    input_tickers = [ticker.upper() for ticker in _SEPARATORS.split(tickers.strip()) if ticker]
+    input_weights = [weight for weight in _SEPARATORS.split(weights.replace("%", "").strip()) if weight]
     if len(input_tickers) != len(input_weights):
         raise ValueError("Number of tickers must match number of weights.")
 
-    tickers_to_use = []
-    ticker_weights = []
-    unavailable_tickers = []
-    for i,ticker in enumerate(input_tickers):
-        ticker = ticker.upper().strip()
-        if ticker not in tickers_univ:
-            unavailable_tickers.append(ticker)
-        else:
-            tickers_to_use.append(ticker)
-            ticker_weights.append(float(input_weights[i].replace("%", "")))
+    is_available = [ticker in tickers_univ for ticker in input_tickers]
+    tickers_to_use = [ticker for ticker, ok in zip(input_tickers, is_available) if ok]
     if len(tickers_to_use) == 0:
         raise ValueError(f"None of the requested tickers {input_tickers} are available in the data.")
-    ticker_weights = [w * 100/ sum(ticker_weights) for w in ticker_weights]  # Normalize weights
+    # only parse the weights of available tickers, as unavailable ones are dropped
+    ticker_weights = np.fromiter((float(weight) for weight, ok in zip(input_weights, is_available) if ok), dtype=np.float64, count=len(tickers_to_use))
+    total_weight = ticker_weights.sum()
+    if total_weight == 0:
+        raise ValueError("Portfolio weights must not sum to zero.")
+    ticker_weights = ticker_weights * (100.0 / total_weight)  # Normalize weights
     #portfolio = dict(zip(tickers_to_use, ticker_weights))
     portfolio_str = ", ".join([f"{weight:.2f}% to {ticker}" for ticker, weight in zip(tickers_to_use, ticker_weights)])
     return f"""
@@ -10,7 +10,7 @@ data_resources.py:
 
 from typing import List
 from utils.misc import (
-    load_price_data
+    load_tickers
 )
 from server import mcp
 from tools.data_tools import DEFAULT_CSV_PATH
@@ -27,5 +27,4 @@ def available_tickers() -> List[str]:
     Returns:
         list of str: List of available ticker symbols.
     """
-    df = load_price_data(DEFAULT_CSV_PATH)
-    return df.columns.tolist()
+    return load_tickers(DEFAULT_CSV_PATH)
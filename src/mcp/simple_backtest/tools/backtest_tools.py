@@ -7,10 +7,14 @@ tools/backtest_tools.py:
 
 
 from server import mcp
+from utils.cache import (
+    cache_key,
+    get_or_compute
+)
 from utils.misc import (
-    load_price_data,
-    get_ticker_data,
-    calculate_portfolio_returns,
+    file_signature,
+    load_returns_matrix,
+    calculate_weighted_returns,
     calculate_performance_metrics
 )
 from tools.data_tools import DEFAULT_CSV_PATH
@@ -26,22 +30,24 @@ def backtest_portfolio(portfolio, price_data_path=DEFAULT_CSV_PATH) -> dict:
             price_data_path (str): Path to the CSV file containing price data.
         
         Returns:
-            dict: A dictionary containing portfolio returns and performance statistics.
+            dict: A dictionary containing portfolio returns (as {"dates": [...], "values": [...]},
+                dates in ISO format) and performance statistics.
     """
-    raw_price_data = load_price_data(price_data_path)
-    
-    # Get tickers from portfolio
-    tickers = list(portfolio.keys())
-    
-    # Get price data for portfolio tickers
-    price_data = get_ticker_data(raw_price_data, tickers)
-    
-    # Calculate portfolio returns
-    portfolio_returns = calculate_portfolio_returns(price_data, portfolio)
-    
-    # Calculate performance metrics
-    performance_stats = calculate_performance_metrics(portfolio_returns)
+    def compute():
+        # Get the returns matrix for the portfolio tickers
+        index, columns, values = load_returns_matrix(price_data_path, list(portfolio.keys()))
+        
+        # Calculate portfolio returns
+        portfolio_returns = calculate_weighted_returns(index, columns, values, portfolio)
+        
+        # Calculate performance metrics
+        performance_stats = calculate_performance_metrics(portfolio_returns)
+        
+        # Plain lists serialize directly, without going through pandas
+        return {"portfolio_returns" : {"dates" : portfolio_returns.index.strftime('%Y-%m-%d').tolist(),
+                                       "values" : portfolio_returns.to_numpy().tolist()},
+                "performance_stats" : performance_stats}
     
-    return {"portfolio_returns" : portfolio_returns,
-            "performance_stats" : performance_stats}
-
+    # Results only depend on the price file version and the weights
+    key = cache_key(file_signature(price_data_path), sorted(portfolio.items()))
+    return get_or_compute(key, compute)
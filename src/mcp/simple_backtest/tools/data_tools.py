@@ -8,8 +8,7 @@ tools/data_tools.py:
 import pandas as pd
 from server import mcp
 from utils.misc import (
-    load_price_data,
-    get_ticker_data
+    load_ticker_data
 )
 
 # Global variable to store the default CSV file path
@@ -27,7 +26,5 @@ def get_price_data(tickers, price_data_path=DEFAULT_CSV_PATH) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing price data for the specified tickers.
     """
-    # Load price data
-    df = load_price_data(price_data_path)
-    # Get data for specified tickers
-    return get_ticker_data(df, tickers)
+    # Load price data for specified tickers only
+    return load_ticker_data(price_data_path, tickers)
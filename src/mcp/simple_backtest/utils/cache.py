@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+"""
+utils/cache.py:
+    1. cache_key: Hashes the inputs of a backtest into a cache key
+    2. get_or_compute: Returns a backtest result from the disk cache, computing and storing it on a miss
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger("portfolio-mcp-server")
+
+DEFAULT_CACHE_DIR = "~/.cache/simple_backtest/"
+
+# set to 0, false, no or off to disable the disk cache
+CACHE_ENV_VAR = "SIMPLE_BACKTEST_CACHE"
+
+# bump whenever the cached results would change for the same inputs
+CACHE_VERSION = 3
+
+# entries unused for longer than this are removed, as are the least recently
+# used ones beyond MAX_ENTRIES
+MAX_AGE_SECONDS = 30 * 24 * 3600
+MAX_ENTRIES = 256
+
+
+def cache_key(*parts: Any) -> str:
+    """Hash the repr of parts (plus CACHE_VERSION) into a file-name-safe key."""
+    return hashlib.blake2b(repr((CACHE_VERSION, parts)).encode(), digest_size=16).hexdigest()
+
+def cache_enabled() -> bool:
+    """Whether the disk cache is not disabled through CACHE_ENV_VAR."""
+    return os.environ.get(CACHE_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
+
+def get_or_compute(key: str,
+                   compute_fn: Callable[[], Dict[str, Any]],
+                   path: str = DEFAULT_CACHE_DIR) -> Dict[str, Any]:
+    """
+    Return the result for key from the disk cache, or call compute_fn and
+    store its result. Results must be JSON-serializable; each is stored as
+    one <key>.json file.
+    """
+    if not cache_enabled():
+        return compute_fn()
+
+    cache_dir = os.path.expanduser(path)
+    json_path = os.path.join(cache_dir, f"{key}.json")
+
+    if os.path.exists(json_path):
+        try:
+            with open(json_path) as f:
+                result = json.load(f)
+            # refresh the entry's age for pruning
+            os.utime(json_path)
+            return result
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {str(e)}")
+
+    result = compute_fn()
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a unique temporary file first so readers and concurrent
+        # writers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, json_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        _prune(cache_dir)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write cache entry {key}: {str(e)}")
+
+    return result
+
+def _prune(cache_dir: str) -> None:
+    """Remove expired entries, then the least recently used ones beyond MAX_ENTRIES."""
+    now = time.time()
+    entries = []
+    for name in os.listdir(cache_dir):
+        file_path = os.path.join(cache_dir, name)
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            continue
+        if name.endswith(".json"):
+            entries.append((mtime, file_path))
+        elif name.endswith(".tmp") and now - mtime > MAX_AGE_SECONDS:
+            # leftovers of interrupted writes
+            _remove_quietly(file_path)
+        elif name.endswith(".feather"):
+            # returns stored separately by cache versions before 3
+            _remove_quietly(file_path)
+
+    entries.sort(reverse=True)
+    for i, (mtime, file_path) in enumerate(entries):
+        if i >= MAX_ENTRIES or now - mtime > MAX_AGE_SECONDS:
+            _remove_quietly(file_path)
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
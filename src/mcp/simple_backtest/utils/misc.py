@@ -8,41 +8,183 @@ This script provides three main tools:
 3. calculate_performance_stats: Computes performance metrics from returns
 """
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+import math
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import pandas as pd
 import numpy as np
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from numba import njit  # optional, compiles the performance metric kernels
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow  # optional, enables the Parquet sidecar cache
+    import pyarrow.parquet
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
 logger = logging.getLogger("portfolio-mcp-server")
 
 
+def file_signature(csv_file_path: str) -> Tuple[str, int, int]:
+    """Return (absolute path, mtime in ns, size) identifying a version of a file."""
+    abspath = os.path.abspath(csv_file_path)
+    stat = os.stat(abspath)
+    return abspath, stat.st_mtime_ns, stat.st_size
+
 def load_price_data(csv_file_path: str) -> pd.DataFrame:
-    """Load price data from CSV file."""
+    """
+    Load price data from CSV file.
+
+    Parsed frames are memoized on (path, mtime, size), so repeated calls for an
+    unchanged file skip the CSV parse. The returned frame is shared between
+    callers and must be treated as read-only.
+    """
     try:
-        df = pd.read_csv(csv_file_path)
-        
-        # Ensure we have a Date column and set it as index
-        if 'Date' not in df.columns:
-            raise ValueError("CSV file must contain a 'Date' column")
-        
-        df['Date'] = pd.to_datetime(df['Date'])
-        df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
-        
-        logger.info(f"Loaded price data with shape: {df.shape}")
-        logger.info(f"Available columns: {df.columns.tolist()}")
-        
-        return df
+        return _load_price_data_cached(*file_signature(csv_file_path))
     except Exception as e:
         logger.error(f"Error loading price data: {str(e)}")
         raise
 
+def _parquet_sidecar_path(csv_file_path: str) -> str:
+    """Path of the Parquet copy kept next to a price data CSV file."""
+    return csv_file_path + '.parquet'
+
+# schema metadata key recording the (mtime_ns, size) of the CSV a sidecar was built from
+_SIDECAR_SOURCE_KEY = b'simple_backtest.source'
+
+def _sidecar_source(mtime_ns: int, size: int) -> bytes:
+    return f"{mtime_ns}:{size}".encode()
+
+def _read_parquet_sidecar(abspath: str, mtime_ns: int, size: int, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet sidecar of a CSV file if it was built from exactly this
+    version of the file. Returns None when it is missing, stale or unreadable.
+    """
+    pq_path = _parquet_sidecar_path(abspath)
+    if not _HAS_PYARROW or not os.path.exists(pq_path):
+        return None
+    try:
+        metadata = pyarrow.parquet.read_schema(pq_path).metadata or {}
+        if metadata.get(_SIDECAR_SOURCE_KEY) != _sidecar_source(mtime_ns, size):
+            return None
+        return pd.read_parquet(pq_path, engine='pyarrow', columns=columns)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Parquet cache {pq_path}: {str(e)}")
+        return None
+
+def _write_parquet_sidecar(abspath: str, mtime_ns: int, size: int, df: pd.DataFrame) -> None:
+    """Atomically write the Parquet sidecar of a CSV file, tagged with its version."""
+    pq_path = _parquet_sidecar_path(abspath)
+    tmp_path = None
+    try:
+        table = pyarrow.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               _SIDECAR_SOURCE_KEY: _sidecar_source(mtime_ns, size)})
+        # write to a temporary file first so readers never see partial sidecars
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(pq_path), suffix='.tmp')
+        os.close(fd)
+        pyarrow.parquet.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, pq_path)
+    except Exception as e:
+        logger.warning(f"Could not write Parquet cache {pq_path}: {str(e)}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+@functools.lru_cache(maxsize=8)
+def _load_price_data_cached(abspath: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse the CSV file; mtime_ns and size only serve as cache keys."""
+    df = _read_parquet_sidecar(abspath, mtime_ns, size)
+    if df is not None:
+        logger.debug(f"Loaded price data with shape: {df.shape} from Parquet cache")
+        return df
+
+    # Ensure we have a Date column before parsing the whole file
+    if 'Date' not in pd.read_csv(abspath, nrows=0).columns:
+        raise ValueError("CSV file must contain a 'Date' column")
+    
+    # Parse dates and set the index in a single pass
+    df = pd.read_csv(abspath, parse_dates=['Date'], index_col='Date', cache_dates=True)
+    if not isinstance(df.index, pd.DatetimeIndex):
+        # read_csv keeps unparseable dates as strings; let to_datetime raise on them
+        df.index = pd.to_datetime(df.index)
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    
+    logger.debug(f"Loaded price data with shape: {df.shape}")
+    logger.debug(f"Available columns: {df.columns.tolist()}")
+
+    # Write the Parquet sidecar so later processes skip the CSV parse
+    if _HAS_PYARROW:
+        _write_parquet_sidecar(abspath, mtime_ns, size, df)
+    
+    return df
+
+def load_tickers(csv_file_path: str) -> List[str]:
+    """
+    Load the ticker symbols (column names other than 'Date') of a price data
+    CSV file. Only the header row is read; results are memoized like
+    load_price_data.
+    """
+    try:
+        return list(_load_tickers_cached(*file_signature(csv_file_path)))
+    except Exception as e:
+        logger.error(f"Error loading tickers: {str(e)}")
+        raise
+
+@functools.lru_cache(maxsize=8)
+def _load_tickers_cached(abspath: str, mtime_ns: int, size: int) -> tuple:
+    """Read the CSV header; mtime_ns and size only serve as cache keys."""
+    columns = pd.read_csv(abspath, nrows=0).columns.tolist()
+    if 'Date' not in columns:
+        raise ValueError("CSV file must contain a 'Date' column")
+    columns.remove('Date')
+    return tuple(columns)
+
 def get_ticker_data(df: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
-    """Extract data for specific tickers from the dataframe."""
-    available_tickers = [col for col in tickers if col in df.columns]
-    missing_tickers = [col for col in tickers if col not in df.columns]
+    """
+    Extract data for specific tickers from the dataframe.
+
+    Column selection already returns a new frame, so no extra .copy() is
+    made on top of it.
+    """
+    return df[_select_tickers(df.columns, tickers)]
+
+def load_ticker_data(csv_file_path: str, tickers: List[str]) -> pd.DataFrame:
+    """
+    Load price data for specific tickers.
+
+    Results are memoized on the file's (path, mtime, size) and the tickers.
+    On a miss only the requested columns are read from the Parquet sidecar
+    when it is available; otherwise they are sliced from load_price_data.
+    The result must be treated as read-only.
+    """
+    try:
+        signature = file_signature(csv_file_path)
+        columns = _select_tickers(_load_tickers_cached(*signature), tickers)
+        return _load_ticker_data_cached(*signature, tuple(columns))
+    except Exception as e:
+        logger.error(f"Error loading ticker data: {str(e)}")
+        raise
+
+@functools.lru_cache(maxsize=32)
+def _load_ticker_data_cached(abspath: str, mtime_ns: int, size: int, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """Read the given columns; mtime_ns and size only serve as cache keys."""
+    df = _read_parquet_sidecar(abspath, mtime_ns, size, columns=list(columns))
+    if df is None:
+        df = _load_price_data_cached(abspath, mtime_ns, size)[list(columns)]
+    return df
+
+def _select_tickers(columns: Sequence[str], tickers: List[str]) -> List[str]:
+    """Return the requested tickers present in columns, warning about the rest."""
+    available_tickers = [col for col in tickers if col in columns]
+    missing_tickers = [col for col in tickers if col not in columns]
     
     if missing_tickers:
         logger.warning(f"Missing tickers: {missing_tickers}")
@@ -50,37 +192,124 @@ def get_ticker_data(df: pd.DataFrame, tickers: List[str]) -> pd.DataFrame:
     if not available_tickers:
         raise ValueError(f"None of the requested tickers {tickers} are available in the data")
     
-    return df[available_tickers].copy()
+    return available_tickers
+
+def load_returns_matrix(csv_file_path: str, tickers: List[str]) -> Tuple[pd.DatetimeIndex, Tuple[str, ...], np.ndarray]:
+    """
+    Load the period returns of the given tickers as (index, columns, values).
+
+    Results are memoized on the file's (path, mtime, size) and the set of
+    tickers, so re-weighting the same tickers only costs a matrix-vector
+    product. The values array is float32 and read-only.
+    """
+    try:
+        return _load_returns_matrix_cached(*file_signature(csv_file_path), frozenset(tickers))
+    except Exception as e:
+        logger.error(f"Error loading returns: {str(e)}")
+        raise
 
-def calculate_portfolio_returns(price_data: pd.DataFrame, weights: Dict[str, float]) -> pd.Series:
-    """Calculate portfolio returns given price data and weights."""
+@functools.lru_cache(maxsize=32)
+def _load_returns_matrix_cached(abspath: str, mtime_ns: int, size: int, tickers: frozenset) -> Tuple[pd.DatetimeIndex, Tuple[str, ...], np.ndarray]:
+    """Compute the returns matrix; mtime_ns and size only serve as cache keys."""
+    df = _load_price_data_cached(abspath, mtime_ns, size)
+    returns = get_ticker_data(df, sorted(tickers)).pct_change().dropna()
+    values = returns.to_numpy(dtype=np.float32)
+    values.flags.writeable = False
+    return returns.index, tuple(returns.columns), values
+
+def calculate_portfolio_returns(price_data: pd.DataFrame, weights: Union[Dict[str, float], np.ndarray]) -> pd.Series:
+    """
+    Calculate portfolio returns given price data and weights.
+
+    weights is either a ticker -> weight dict or an array aligned with the
+    price_data columns.
+    """
     # Calculate daily returns
     returns = price_data.pct_change().dropna()
     
-    # Normalize weights to sum to 1
-    total_weight = sum(weights.values())
-    normalized_weights = {ticker: weight/total_weight for ticker, weight in weights.items()}
-    
-    # Calculate weighted portfolio returns
-    portfolio_returns = pd.Series(0.0, index=returns.index)
-    
-    for ticker, weight in normalized_weights.items():
-        if ticker in returns.columns:
-            portfolio_returns += returns[ticker] * weight
+    return calculate_weighted_returns(returns.index, returns.columns, returns.to_numpy(dtype=np.float64), weights)
+
+def calculate_weighted_returns(index: pd.Index, columns: Sequence[str], values: np.ndarray, weights: Union[Dict[str, float], np.ndarray]) -> pd.Series:
+    """
+    Calculate portfolio returns given a returns matrix and weights.
+
+    weights is either a ticker -> weight dict, normalized by the sum of all
+    its values so that tickers missing from columns stay uninvested, or an
+    array aligned with columns, normalized by its own sum.
+
+    The product runs in the dtype of values (float32 for the cached matrix);
+    the resulting series is always float64.
+    """
+    # Align weights with the return columns, normalized to sum to 1
+    if isinstance(weights, dict):
+        total_weight = sum(weights.values())
+        w = np.fromiter((weights.get(ticker, 0.0) for ticker in columns), dtype=np.float64, count=len(columns))
+    else:
+        w = np.asarray(weights, dtype=np.float64)
+        total_weight = w.sum()
+    if total_weight == 0:
+        raise ValueError("Portfolio weights must not sum to zero")
+    w = (w / total_weight).astype(values.dtype, copy=False)
     
-    return portfolio_returns
+    # Calculate weighted portfolio returns as a single matrix-vector product
+    portfolio_returns = values @ w
+    return pd.Series(portfolio_returns.astype(np.float64, copy=False), index=index, name='portfolio')
 
 def calculate_cumulative_returns(returns: pd.Series) -> pd.Series:
     """Calculate cumulative returns from raw returns."""
     return (1 + returns).cumprod() - 1
 
+def _fused_metrics_loop(r: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Return the total log return, the maximum drawdown and the standard
+    deviation of the negative returns of a non-empty return array in a single
+    pass. Compiled with numba when available.
+    """
+    log_cumulative = 0.0
+    peak = -math.inf
+    min_drawdown = 0.0
+    # Welford's running mean and sum of squared deviations of negative returns
+    n_neg = 0
+    mean_neg = 0.0
+    m2_neg = 0.0
+    for i in range(r.size):
+        log_cumulative += math.log1p(r[i])
+        if log_cumulative > peak:
+            peak = log_cumulative
+        elif log_cumulative - peak < min_drawdown:
+            min_drawdown = log_cumulative - peak
+        if r[i] < 0:
+            n_neg += 1
+            delta = r[i] - mean_neg
+            mean_neg += delta / n_neg
+            m2_neg += delta * (r[i] - mean_neg)
+    downside_std = math.sqrt(m2_neg / (n_neg - 1)) if n_neg > 1 else math.nan
+    return log_cumulative, math.expm1(min_drawdown), downside_std
+
+def _fused_metrics_numpy(r: np.ndarray) -> Tuple[float, float, float]:
+    """Vectorized fallback for _fused_metrics_loop."""
+    log_cumulative = np.cumsum(np.log1p(r))
+    running_max = np.maximum.accumulate(log_cumulative)
+    negative_returns = r[r < 0]
+    downside_std = negative_returns.std(ddof=1) if negative_returns.size > 1 else math.nan
+    return log_cumulative[-1], math.expm1((log_cumulative - running_max).min()), downside_std
+
+if njit is not None:
+    _fused_metrics = njit(cache=True)(_fused_metrics_loop)
+else:
+    _fused_metrics = _fused_metrics_numpy
+
 def calculate_performance_metrics(returns: pd.Series) -> Dict[str, float]:
     """Calculate comprehensive performance statistics for a return series."""
     if len(returns) == 0:
         return {}
     
-    # Basic statistics
-    total_return = (1 + returns).prod() - 1
+    # Work on a contiguous float array; every reduction below reuses it
+    r = np.ascontiguousarray(returns.to_numpy(dtype=np.float64))
+    
+    # Basic statistics, maximum drawdown and downside std in one pass
+    log_total, max_drawdown, downside_std = _fused_metrics(r)
+    total_return = np.expm1(log_total)
     
     # Annualized metrics (assuming monthly data)
     trading_days = 12 # 252
@@ -90,35 +319,37 @@ def calculate_performance_metrics(returns: pd.Series) -> Dict[str, float]:
     years = len(returns) / periods_per_year
     
     if years > 0:
-        annualized_return = (1 + total_return) ** (1/years) - 1
+        annualized_return = np.expm1(log_total / years)
     else:
         annualized_return = 0.0
     
-    annualized_volatility = returns.std() * np.sqrt(periods_per_year)
+    annualized_volatility = (r.std(ddof=1) if r.size > 1 else math.nan) * np.sqrt(periods_per_year)
     
     # Sharpe ratio (assuming risk-free rate of 0)
     sharpe_ratio = annualized_return / annualized_volatility if annualized_volatility != 0 else 0.0
     
-    # Maximum drawdown
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    max_drawdown = drawdown.min()
-    
     # Downside deviation and Sortino ratio
-    negative_returns = returns[returns < 0]
-    downside_deviation = negative_returns.std() * np.sqrt(periods_per_year)
+    downside_deviation = downside_std * np.sqrt(periods_per_year)
     sortino_ratio = annualized_return / downside_deviation if downside_deviation != 0 else 0.0
     
     # Win rate
-    win_rate = len(returns[returns > 0]) / len(returns) if len(returns) > 0 else 0.0
+    win_rate = np.count_nonzero(r > 0) / r.size
     
     # Calmar ratio
     calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0.0
     
-    # VaR and CVaR (5% level)
-    var_5 = returns.quantile(0.05)
-    cvar_5 = returns[returns <= var_5].mean()
+    # VaR (linearly interpolated, as np.quantile) and CVaR (5% level) from a
+    # single partition; the CVaR tail lies in the first hi + 1 positions
+    h = 0.05 * (r.size - 1)
+    lo = int(h)
+    hi = min(lo + 1, r.size - 1)
+    partitioned = np.partition(r, (lo, hi))
+    var_5 = partitioned[lo] + (h - lo) * (partitioned[hi] - partitioned[lo])
+    tail = partitioned[:hi + 1]
+    tail = tail[tail <= var_5]
+    # values tied with var_5 may also sit to the right of hi
+    ties = np.count_nonzero(partitioned[hi + 1:] == var_5) if var_5 == partitioned[hi] else 0
+    cvar_5 = (tail.sum() + ties * var_5) / (tail.size + ties)
     
     return {
         "total_return": float(total_return),